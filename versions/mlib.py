@@ -1,4 +1,7 @@
-from typing import List
+from typing import Sequence, Tuple
+import builtins
+import itertools
+import math
 import struct
 import time
 
@@ -6,24 +9,46 @@ PI      = 3.1415926535897932
 TAU     = 6.2831853071795864
 E       = 2.7182818284590452
 PHI     = 1.6180339887498948
+SQRT2   = 1.4142135623730951
 LN2     = 0.6931471805599453
 LN10    = 2.3025850929940457
 LOG2E   = 1.4426950408889634
 LOG10E  = 0.4342944819032518
 EULER   = 0.5772156649015329
 CATALAN = 0.9159655941772190
+DEG2RAD = 0.017453292519943295
+RAD2DEG = 57.29577951308232
+
+# Taylor series coefficients (-1)^k / (2k + 1)! and (-1)^k / (2k)! used by sin and cos.
+SIN_COEFFS = (1.0, -1 / 6, 1 / 120, -1 / 5040, 1 / 362880, -1 / 39916800, 1 / 6227020800, -1 / 1307674368000)
+COS_COEFFS = (1.0, -1 / 2, 1 / 24, -1 / 720, 1 / 40320, -1 / 3628800, 1 / 479001600, -1 / 87178291200)
+
+# Reciprocal factorials 1 / i! used by the Taylor series in exp.
+INV_FACT = tuple(1 / math.factorial(i) for i in range(13))
+
+# Series coefficients 2 / (2k + 1) of 2 * atanh(x), used by ln.
+LN_COEFFS = tuple(2 / (2 * i + 1) for i in range(10))
+
+# Minimax coefficients of atan(x) / x in x^2 on [0, 1] (Abramowitz and Stegun 4.4.49), used by atan.
+ATAN_COEFFS = (1.0, -0.3333314528, 0.1999355085, -0.1420889944, 0.1065626393, -0.0752896400, 0.0429096138, -0.0161657367, 0.0028662257)
+
+# Precompiled native byte order layouts used to reinterpret the bits of floats and integers.
+_F32 = struct.Struct('=f')
+_I32 = struct.Struct('=i')
+_F64 = struct.Struct('=d')
+_I64 = struct.Struct('=q')
 
 def to_bits(a):
     assert is_finite(a)
 
-    s = struct.pack('>f', a)
-    return struct.unpack('>l', s)[0]
+    s = _F32.pack(a)
+    return _I32.unpack(s)[0]
 
 def to_float(a):
     assert is_finite(a)
 
-    s = struct.pack('>l', a)
-    return struct.unpack('>f', s)[0]
+    s = _I32.pack(a)
+    return _F32.unpack(s)[0]
 
 # Converts degrees to radians.
 #
@@ -32,7 +57,7 @@ def to_float(a):
 # @note This function asserts that the input is finite.
 def to_radian(deg: float) -> float:
     assert is_finite(deg)
-    return deg * (PI / 180)
+    return deg * DEG2RAD
 
 # Converts radians to degrees.
 #
@@ -41,7 +66,7 @@ def to_radian(deg: float) -> float:
 # @note This function asserts that the input is finite.
 def to_degree(rad: float) -> float:
     assert is_finite(rad)
-    return rad * (180 / PI)
+    return rad * RAD2DEG
 
 # Calculates the floor of a given double value.
 #
@@ -50,7 +75,7 @@ def to_degree(rad: float) -> float:
 # @note This function asserts that the input is finite.
 def floor(a: float) -> int:
     assert is_finite(a)
-    return int(a)
+    return math.floor(a)
 
 # Calculates the ceiling of a given double value.
 #
@@ -59,16 +84,17 @@ def floor(a: float) -> int:
 # @note This function asserts that the input is finite.
 def ceil(a: float) -> int:
     assert is_finite(a)
-    return int(a + 1) if a > int(a) else int(a)
+    return math.ceil(a)
 
 # Rounds a given double value to the nearest integer.
 #
 # @param a The double value to round.
 # @return The nearest integer to the input value.
 # @note This function asserts that the input is finite.
+# @note Halfway cases are rounded up, towards positive infinity.
 def round(a: float) -> int:
     assert is_finite(a)
-    return int(a + 1) if a + 0.5 >= int(a + 1) else int(a)
+    return math.floor(a + 0.5)
 
 # Calculates the absolute value of a given double.
 #
@@ -77,24 +103,37 @@ def round(a: float) -> int:
 # @note This function asserts that the input is finite.
 def abs(a: float) -> float:
     assert is_finite(a)
-    return -a if a < 0 else a
+    return builtins.abs(a)
 
 # Calculates the square root of a given number using the Newton-Raphson method.
 #
 # @param a The number to calculate the square root of.
 # @return The square root of the input number.
 # @note This function asserts that the input is finite and non-negative.
+# @note The initial guess comes from the double precision variant of the "Fast Inverse Square Root" bit hack,
+#       so only a few Newton-Raphson iterations are needed to reach full precision.
+# @note Subnormal inputs are scaled by 2^54 into the normal range and the result is scaled back by 2^-27.
 def sqrt(a: float) -> float:
 	assert is_finite(a) and a >= 0
 
 	if a == 0:
 		return 0
 
-	b = a
-	root = 0
+	# Subnormal values have no implicit leading bit, so scale them into the normal range first.
+	if a < 2.2250738585072014E-308:
+		return sqrt(a * 18014398509481984) * 7.450580596923828E-9
+
+	s = _F64.pack(a)
+	i = _I64.unpack(s)[0]
+	i = 0x5fe6eb50c7b537a9 - (i >> 1)
+	s = _I64.pack(i)
+	y = _F64.unpack(s)[0]
+	y *= (1.5 - (a * 0.5 * y * y))
 
-	for _ in range(1, 17):
-		b = root = (b + (a / b)) / 2
+	root = a * y
+
+	for _ in range(3):
+		root = 0.5 * (root + a / root)
 
 	return root
 
@@ -144,16 +183,20 @@ def root(a: float, exp: int) -> float:
 
     return result
 
-# Calculates the Greatest Common Divisor (GCD) of two integers using the Euclidean algorithm.
+# Calculates the Greatest Common Divisor (GCD) of two integers.
 #
 # @param a The first integer.
 # @param b The second integer.
 # @return The GCD of a and b.
 # @note This function asserts that both inputs are finite.
 # @note The function uses the absolute values of the inputs to handle negative numbers.
+# @note For integer inputs, the calculation is done in C by math.gcd, which uses Lehmer's algorithm for large integers.
+# @note Float inputs fall back to the Euclidean algorithm and return a float, e.g. gcd(4.0, 6.0) returns 2.0.
 def gcd(a: int, b: int) -> int:
     assert is_finite(a) and is_finite(b)
 
+    if isinstance(a, int) and isinstance(b, int): return math.gcd(a, b)
+
     if a < 0: a = -a
     if b < 0: b = -b
 
@@ -171,11 +214,14 @@ def gcd(a: int, b: int) -> int:
 # @param b The second integer.
 # @return The LCM of a and b.
 # @note This function asserts that both inputs are finite.
-# @note The function uses the GCD to calculate the LCM efficiently.
-# @note If the GCD is 0, the function returns 0 to avoid division by zero.
+# @note For integer inputs, the calculation is done in C by math.lcm, which requires Python 3.9 or newer.
+# @note Float inputs fall back to dividing by the GCD and return a float.
+# @note If either input is 0, the function returns 0.
 def lcm(a: int, b: int) -> int:
     assert is_finite(a) and is_finite(b)
 
+    if isinstance(a, int) and isinstance(b, int): return math.lcm(a, b)
+
     result = gcd(a, b)
     if result == 0: return 0
 
@@ -186,13 +232,20 @@ def lcm(a: int, b: int) -> int:
 # @param a The non-negative integer for which to calculate the factorial.
 # @return The factorial of the input number.
 # @note This function asserts that the input is finite and non-negative.
-# @note The factorial is calculated recursively, which may lead to stack overflow for large inputs.
-# @warning This implementation is not suitable for large inputs due to potential stack overflow.
+# @note For integer inputs, the calculation is done in C by math.factorial, which uses binary splitting for large inputs.
+# @note Float inputs fall back to an iterative product and return a float, e.g. fact(5.0) returns 120.0.
 def fact(a: int) -> int:
-    assert is_finite(a)
-    if a <= 1: return 1
+    assert is_finite(a) and a >= 0
+
+    if isinstance(a, int): return math.factorial(a)
+
+    result = 1.0
 
-    return a * fact(a - 1)
+    while a > 1:
+        result *= a
+        a -= 1
+
+    return result
 
 # Generates a random integer within a specified range using a linear congruential generator (LCG).
 #
@@ -251,17 +304,25 @@ def fdiv(a: float, b: float) -> int:
 # @return The result of base raised to the power of pow.
 # @note This function asserts that both base and pow are finite.
 # @note For pow = 0, the function returns 1.
-# @note The function uses a simple iterative approach for positive exponents.
+# @note For negative exponents, the function returns the reciprocal of the positive power.
+# @note The function uses exponentiation by squaring, needing O(log pow) multiplications.
 def pow(base: float, power: int) -> float:
     assert is_finite(base) and is_finite(power)
 
+    if power < 0: return 1 / pow(base, -power)
     if power == 0: return 1
+    if power == 1: return base
+    if power == 2: return base * base
 
-    product = base
+    result = 1
 
-    for i in range(1, power): product *= base
+    while power:
+        if power & 1: result *= base
 
-    return product
+        base *= base
+        power >>= 1
+
+    return result
 
 # Checks if a given integer is prime.
 #
@@ -269,16 +330,20 @@ def pow(base: float, power: int) -> float:
 # @return True if the number is prime, False otherwise.
 # @note This function asserts that the input is finite.
 # @note Numbers less than 2 are not considered prime.
-# @note Even numbers greater than 2 are not prime.
-# @note The function checks for divisibility up to half of the input number.
+# @note Multiples of 2 and 3 greater than 3 are not prime.
+# @note The function checks candidates of the form 6k +/- 1 up to the square root of the input number.
 def is_prime(a: int) -> bool:
     assert is_finite(a)
 
     if a < 2: return False
-    if a > 2 and a % 2 == 0: return False
+    if a < 4: return True
+    if a % 2 == 0 or a % 3 == 0: return False
 
-    for i in range(2, a // 2):
-        if a % i == 0: return False
+    i = 5
+
+    while i * i <= a:
+        if a % i == 0 or a % (i + 2) == 0: return False
+        i += 6
 
     return True
 
@@ -286,23 +351,23 @@ def is_prime(a: int) -> bool:
 #
 # @param a The double value to check.
 # @return True if the value is finite, False otherwise.
+# @note Integers are always finite, this also keeps integers too large to convert to a double valid.
 def is_finite(a: float) -> bool:
-	return not is_infinite(a) and not is_nan(a)
+	return isinstance(a, int) or math.isfinite(a)
 
 # Checks if a given double value is infinite.
 #
 # @param a The double value to check.
 # @return True if the value is infinite, False otherwise.
 def is_infinite(a: float) -> bool:
-	return a / a != a / a
+	return not isinstance(a, int) and math.isinf(a)
 
 # Checks if a given double value is Not-a-Number (NaN).
 #
 # @param a The double value to check.
 # @return True if the value is NaN, False otherwise.
-# @note This function compares the value to itself, as NaN is the only value that is not equal to itself.
 def is_nan(a: float) -> bool:
-	return a != a
+	return not isinstance(a, int) and math.isnan(a)
 
 # Calculates the sine of an angle using Taylor series approximation.
 #
@@ -311,19 +376,19 @@ def is_nan(a: float) -> bool:
 # @note This function asserts that the input is finite.
 # @note The function normalizes the input angle to the range [-PI, PI].
 # @note The Taylor series is computed up to the 7th term for accuracy.
+# @note The series is evaluated in Horner form using precomputed coefficients, avoiding divisions.
 def sin(a: float) -> float:
     assert is_finite(a)
 
-    while a > PI: a -= 2 * PI
-    while a < -PI: a += 2 * PI
+    a -= ((a + PI) // TAU) * TAU
 
-    result = term = a
+    a2 = a * a
+    result = SIN_COEFFS[7]
 
-    for i in range(1, 8):
-        term *= -a * a / ((2 * i) * (2 * i + 1))
-        result += term
+    for i in range(6, -1, -1):
+        result = result * a2 + SIN_COEFFS[i]
 
-    return result
+    return a * result
 
 # Calculates the cosine of an angle using Taylor series approximation.
 #
@@ -332,20 +397,42 @@ def sin(a: float) -> float:
 # @note This function asserts that the input is finite.
 # @note The function normalizes the input angle to the range [-PI, PI].
 # @note The Taylor series is computed up to the 7th term for accuracy.
+# @note The series is evaluated in Horner form using precomputed coefficients, avoiding divisions.
 def cos(a: float) -> float:
     assert is_finite(a)
 
-    while a > PI: a -= 2 * PI
-    while a < -PI: a += 2 * PI
+    a -= ((a + PI) // TAU) * TAU
 
-    result = term = 1
+    a2 = a * a
+    result = COS_COEFFS[7]
 
-    for i in range(1, 8):
-        term *= -a * a / ((2 * i - 1) * (2 * i))
-        result += term
+    for i in range(6, -1, -1):
+        result = result * a2 + COS_COEFFS[i]
 
     return result
 
+# Calculates both the sine and cosine of an angle using Taylor series approximation.
+#
+# @param a The angle in radians.
+# @return A tuple containing the sine and cosine of the input angle.
+# @note This function asserts that the input is finite.
+# @note The function normalizes the input angle to the range [-PI, PI] once for both results.
+# @note Both Taylor series are computed up to the 7th term in a single Horner loop sharing a * a.
+def sincos(a: float) -> Tuple[float, float]:
+    assert is_finite(a)
+
+    a -= ((a + PI) // TAU) * TAU
+
+    a2 = a * a
+    sin_result = SIN_COEFFS[7]
+    cos_result = COS_COEFFS[7]
+
+    for i in range(6, -1, -1):
+        sin_result = sin_result * a2 + SIN_COEFFS[i]
+        cos_result = cos_result * a2 + COS_COEFFS[i]
+
+    return a * sin_result, cos_result
+
 # Calculates the tangent of an angle.
 #
 # @param a The angle in radians.
@@ -355,11 +442,26 @@ def cos(a: float) -> float:
 def tan(a: float) -> float:
     assert is_finite(a)
 
-    s = sin(a)
-    c = cos(a)
+    s, c = sincos(a)
 
     return s / c
 
+# Calculates both the hyperbolic sine and hyperbolic cosine of a given value.
+#
+# @param a The input value in radians.
+# @return A tuple containing the hyperbolic sine and hyperbolic cosine of the input value.
+# @note This function asserts that the input is finite.
+# @note The function uses a single call to the exponential function, as e^-a is the reciprocal of e^a.
+# @note The function evaluates e^|a| and uses the symmetry of sinh and cosh, so large negative and positive inputs behave the same.
+def sinhcosh(a: float) -> Tuple[float, float]:
+    assert is_finite(a)
+
+    ea = exp(abs(a))
+    eai = 1 / ea
+    s = (ea - eai) * 0.5
+
+    return (-s if a < 0 else s), (ea + eai) * 0.5
+
 # Calculates the hyperbolic sine of a given value.
 #
 # @param a The input value in radians.
@@ -372,8 +474,8 @@ def sinh(a: float) -> float:
 
     if a == 0: return 0
 
-    ea = exp(a)
-    return (ea - (1 / ea)) / 2
+    s, _ = sinhcosh(a)
+    return s
 
 # Calculates the hyperbolic cosine of a given value.
 #
@@ -387,8 +489,8 @@ def cosh(a: float) -> float:
 
     if a == 0: return 1
 
-    ea = exp(a)
-    return (ea + (1 / ea)) / 2
+    _, c = sinhcosh(a)
+    return c
 
 # Calculates the hyperbolic tangent of a given value.
 #
@@ -396,14 +498,17 @@ def cosh(a: float) -> float:
 # @return The hyperbolic tangent of the input value.
 # @note This function asserts that the input is finite.
 # @note For a = 0, the function returns 0.
+# @note For |a| > 20, the function returns -1 or 1, as the result is indistinguishable from them in double precision.
 # @note The function uses the exponential function to compute the result.
 def tanh(a: float) -> float:
     assert is_finite(a)
 
     if a == 0: return 0
+    if a > 20: return 1
+    if a < -20: return -1
 
-    ea = exp(2 * a)
-    return (ea - 1) / (ea + 1)
+    s, c = sinhcosh(a)
+    return s / c
 
 # Calculates the arcsine (inverse sine) of a given value using a polynomial approximation.
 #
@@ -414,7 +519,7 @@ def tanh(a: float) -> float:
 def asin(a: float) -> float:
     assert is_finite(a) and a >= -1 and a <= 1
 
-    a2 = pow(a, 2)
+    a2 = a * a
     return a + a * a2 * (1 / 6 + a2 * (3 / 40 + a2 * (5 / 112 + a2 * 35 / 1152)))
 
 # Calculates the arccosine (inverse cosine) of a given value.
@@ -427,15 +532,32 @@ def acos(a: float) -> float:
     assert is_finite(a) and a >= -1 and a <= 1
     return (PI / 2) - asin(a)
 
-# Calculates the arctangent (inverse tangent) of a given value using an approximation.
+# Calculates the arctangent (inverse tangent) of a given value using a polynomial approximation.
 #
 # @param a The input value.
 # @return The arctangent of the input value in radians.
 # @note This function asserts that the input is finite.
-# @note This approximation is less accurate for large input values.
+# @note For |a| > 1, the function uses the relationship: atan(x) = PI/2 - atan(1/x).
+# @note The approximation uses a minimax polynomial evaluated in Horner form, with an error below 2E-8.
 def atan(a: float) -> float:
     assert is_finite(a)
-    return a / (1.28 * pow(a, 2))
+
+    sign = 1 if a >= 0 else -1
+    a *= sign
+
+    inverse = a > 1
+    if inverse: a = 1 / a
+
+    a2 = a * a
+    result = ATAN_COEFFS[8]
+
+    for i in range(7, -1, -1):
+        result = result * a2 + ATAN_COEFFS[i]
+
+    result *= a
+    if inverse: result = PI / 2 - result
+
+    return sign * result
 
 # Calculates the arctangent of two variables (atan2).
 #
@@ -527,8 +649,7 @@ def csc(a: float) -> float:
 def cot(a: float) -> float:
     assert is_finite(a)
 
-    s = sin(a)
-    c = cos(a)
+    s, c = sincos(a)
 
     return c / s
 
@@ -544,8 +665,8 @@ def sech(a: float) -> float:
 
     if a == 0: return 1
 
-    ea = exp(a)
-    return 2 / (ea + (1 / ea))
+    _, c = sinhcosh(a)
+    return 1 / c
 
 # Calculates the hyperbolic cosecant of a given value.
 #
@@ -556,20 +677,24 @@ def sech(a: float) -> float:
 def csch(a: float) -> float:
     assert is_finite(a)
 
-    ea = exp(a)
-    return 2 / (ea - (1 / ea))
+    s, _ = sinhcosh(a)
+    return 1 / s
 
 # Calculates the hyperbolic cotangent of a given value.
 #
 # @param a The input value in radians.
 # @return The hyperbolic cotangent of the input value.
 # @note This function asserts that the input is finite.
+# @note For |a| > 20, the function returns -1 or 1, as the result is indistinguishable from them in double precision.
 # @note The function uses the exponential function to compute the result.
 def coth(a: float) -> float:
     assert is_finite(a)
 
-    ea = exp(2 * a)
-    return (ea + 1) / (ea - 1)
+    if a > 20: return 1
+    if a < -20: return -1
+
+    s, c = sinhcosh(a)
+    return c / s
 
 # Calculates the exponential function (e^x) for a given value.
 #
@@ -579,6 +704,7 @@ def coth(a: float) -> float:
 # @note The function uses a Taylor series approximation combined with exponent reduction.
 # @note For a = 0, the function returns 1.
 # @note The calculation is optimized for accuracy and efficiency.
+# @note The series is evaluated in Horner form and scaled by 2^k through the exponent bits with math.ldexp.
 def exp(a: float) -> float:
     assert is_finite(a)
 
@@ -586,16 +712,12 @@ def exp(a: float) -> float:
 
     k = int(a * LOG2E)
     r = a - k * LN2
-    result = r + 1
-    term = r
-
-    for i in range(2, 13):
-        term *= r / i
-        result += term
+    result = INV_FACT[12]
 
-        if term < 1E-15 * result: break
+    for i in range(11, -1, -1):
+        result = result * r + INV_FACT[i]
 
-    return result * pow(2, k)
+    return math.ldexp(result, k)
 
 # Finds the minimum of two double values.
 #
@@ -605,7 +727,7 @@ def exp(a: float) -> float:
 # @note This function asserts that both inputs are finite.
 def min(a: float, b: float) -> float:
     assert is_finite(a) and is_finite(b)
-    return a if a < b else b
+    return builtins.min(a, b)
 
 # Finds the maximum of two double values.
 #
@@ -615,7 +737,7 @@ def min(a: float, b: float) -> float:
 # @note This function asserts that both inputs are finite.
 def max(a: float, b: float) -> float:
     assert is_finite(a) and is_finite(b)
-    return a if a > b else b
+    return builtins.max(a, b)
 
 # Clamps a double value between a minimum and maximum range.
 #
@@ -626,45 +748,42 @@ def max(a: float, b: float) -> float:
 # @note This function asserts that all inputs are finite.
 def clamp(value: float, min_val: float, max_val: float) -> float:
     assert is_finite(value) and is_finite(min_val) and is_finite(max_val)
-
-    if value < min_val: return min_val
-    if value > max_val: return max_val
-
-    return value
+    return builtins.max(min_val, builtins.min(value, max_val))
 
 # Calculates the natural logarithm of a given value.
 #
 # @param a The input value, must be greater than 0.
 # @return The natural logarithm of the input value.
 # @note This function asserts that the input is finite and greater than 0.
-# @note The function uses a series expansion for improved accuracy.
+# @note The exponent is read directly from the IEEE-754 bits, leaving a mantissa in the range [sqrt(0.5), sqrt(2)].
+# @note The mantissa is evaluated with a fixed-length 2 * atanh((m - 1) / (m + 1)) series in Horner form.
 def ln(a: float) -> float:
     assert is_finite(a) and a > 0
 
     if a == 1: return 0
 
-    exp = 0
-
-    while a > 2:
-        a /= 2
-        exp += 1
+    # Subnormal values have no implicit leading bit, so scale them into the normal range first.
+    if a < 2.2250738585072014E-308: return ln(a * 18014398509481984) - 54 * LN2
 
-    while a < 1:
-        a *= 2
-        exp -= 1
+    s = _F64.pack(a)
+    i = _I64.unpack(s)[0]
+    exp = ((i >> 52) & 0x7ff) - 1023
+    i = (i & 0x000fffffffffffff) | 0x3ff0000000000000
+    s = _I64.pack(i)
+    a = _F64.unpack(s)[0]
 
-    a -= 1
+    if a > SQRT2:
+        a *= 0.5
+        exp += 1
 
-    y = a
-    sum = y
-    i = 1
+    x = (a - 1) / (a + 1)
+    x2 = x * x
+    result = LN_COEFFS[9]
 
-    while abs(y) > 1E-15:
-        i += 1
-        y *= -a * (i - 1) / i
-        sum += y
+    for i in range(8, -1, -1):
+        result = result * x2 + LN_COEFFS[i]
 
-    return sum + exp * LN2
+    return x * result + exp * LN2
 
 # Calculates the logarithm of a value with a specified base.
 #
@@ -696,89 +815,78 @@ def log10(a: float) -> float:
 
 # Calculates the sum of an array of doubles.
 #
-# @param data List of double values.
+# @param data Sequence of double values, such as a list or an array.array('d').
 # @return The sum of all elements in the array.
-# @note This function asserts that the input list is finite and non-empty.
-def sum(data: List[float]) -> float:
+# @note This function asserts that the input sequence is finite and non-empty.
+# @note The summation is done in C by math.fsum, which tracks partial sums to avoid loss of precision.
+def sum(data: Sequence[float]) -> float:
     assert is_finite(len(data)) and len(data) > 0
-
-    sum = 0
-
-    for i in range(len(data)):
-        sum += data[i]
-
-    return sum
+    return math.fsum(data)
 
 # Calculates the arithmetic mean of an array of doubles.
 #
-# @param data List of double values.
+# @param data Sequence of double values, such as a list or an array.array('d').
 # @return The arithmetic mean of all elements in the array.
-# @note This function asserts that the input list is finite and non-empty.
-def mean(data: List[float]) -> float:
+# @note This function asserts that the input sequence is finite and non-empty.
+def mean(data: Sequence[float]) -> float:
     assert is_finite(len(data)) and len(data) > 0
     return sum(data) / len(data)
 
 # Calculates the median of an array of doubles.
 #
-# @param data List of double values.
+# @param data Sequence of double values, such as a list or an array.array('d').
 # @return The median value of the array.
-# @note This function asserts that the input list is finite and non-empty.
-# @note This function modifies the original list by sorting it.
-def median(data: List[float]) -> float:
+# @note This function asserts that the input sequence is finite and non-empty.
+# @note This function sorts a copy of the data, the original sequence is not modified.
+def median(data: Sequence[float]) -> float:
     assert is_finite(len(data)) and len(data) > 0
 
     size = len(data)
-
-    for i in range(size - 1):
-        for j in range(size - i - 1):
-            if data[j] > data[j + 1]:
-                data[j], data[j + 1] = data[j + 1], data[j]
+    data = sorted(data)
 
     if size % 2 == 0: return (data[size // 2 - 1] + data[size // 2]) / 2
     else: return data[size // 2]
 
 # Calculates the mode of an array of doubles.
 #
-# @param data List of double values.
+# @param data Sequence of double values, such as a list or an array.array('d').
 # @return The mode (most frequent value) of the array.
-# @note This function asserts that the input list is finite and non-empty.
+# @note This function asserts that the input sequence is finite and non-empty.
 # @note If multiple modes exist, this function returns the first one encountered.
-def mode(data: List[float]) -> float:
+# @note Equal values are expected to be adjacent, for example in sorted input.
+# @note Runs of equal values are found in C by itertools.groupby, so the loop only iterates once per run.
+def mode(data: Sequence[float]) -> float:
     assert is_finite(len(data)) and len(data) > 0
 
     mode = data[0]
-    max_count = 1
-    current_count = 1
-
-    for i in range(1, len(data)):
-        if data[i] == data[i - 1]:
-            current_count += 1
-        else:
-            if current_count > max_count:
-                max_count = current_count
-                mode = data[i - 1]
+    max_count = 0
 
-            current_count = 1
+    for value, run in itertools.groupby(data):
+        count = len(list(run))
 
-    if current_count > max_count:
-        mode = data[-1]
+        if count > max_count:
+            max_count = count
+            mode = value
 
     return mode
 
 # Calculates the sample standard deviation of an array of doubles.
 #
-# @param data List of double values.
+# @param data Sequence of double values, such as a list or an array.array('d').
 # @return The sample standard deviation of the array.
-# @note This function asserts that the input list is finite and has more than one element.
-def stddev(data: List[float]) -> float:
+# @note This function asserts that the input sequence is finite and has more than one element.
+# @note The function uses Welford's algorithm, updating the mean and squared deviations in a single pass.
+def stddev(data: Sequence[float]) -> float:
     assert is_finite(len(data)) and len(data) > 1
 
-    size = len(data)
-    m = mean(data)
-    sum = 0
+    size = 0
+    m = 0.0
+    m2 = 0.0
 
-    for i in range(size):
-        diff = data[i] - m
-        sum += diff * diff
+    for x in data:
+        size += 1
+        diff = x - m
+        m += diff / size
+        m2 += diff * (x - m)
 
-    return sqrt(sum / (size - 1))
+    return sqrt(m2 / (size - 1))